@@ -110,12 +110,15 @@ def build_pep_graph(
     return G
 
 
-def calculate_node_metrics(G: nx.DiGraph) -> pd.DataFrame:
+def calculate_node_metrics(
+    G: nx.DiGraph, compute_pagerank: bool = True
+) -> pd.DataFrame:
     """
     有向グラフから各ノードのメトリクスを計算
 
     Args:
         G: NetworkX DiGraph
+        compute_pagerank: Falseの場合はPageRankを計算せず、pagerank列をNaNにする
 
     Returns:
         DataFrame with columns: pep_number, in_degree, out_degree, degree, pagerank
@@ -125,7 +128,11 @@ def calculate_node_metrics(G: nx.DiGraph) -> pd.DataFrame:
     # 各メトリクスを辞書で一括取得
     in_degrees = dict(G.in_degree())
     out_degrees = dict(G.out_degree())
-    pagerank_dict = nx.pagerank(G, alpha=0.85)
+    # PageRank（べき乗法）が最も重い処理のため、不要な場合は省略できるようにする
+    if compute_pagerank:
+        pagerank_dict = nx.pagerank(G, alpha=0.85)
+    else:
+        pagerank_dict = dict.fromkeys(G.nodes(), float("nan"))
 
     nodes = list(G.nodes())
     metrics_df = pd.DataFrame(
@@ -139,7 +146,8 @@ def calculate_node_metrics(G: nx.DiGraph) -> pd.DataFrame:
     )
 
     logger.info(f"Calculated metrics for {len(metrics_df)} PEPs")
-    logger.info(f"PageRank sum: {metrics_df['pagerank'].sum():.6f}")
+    if compute_pagerank:
+        logger.info(f"PageRank sum: {metrics_df['pagerank'].sum():.6f}")
 
     return metrics_df
 
@@ -157,8 +165,9 @@ def save_graph(G: nx.DiGraph, output_path: Path) -> None:
     # ディレクトリが存在しない場合は作成
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # 読み込み側も同じPythonで実行するため、最新のプロトコルで保存する
     with open(output_path, "wb") as f:
-        pickle.dump(G, f)
+        pickle.dump(G, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     logger.info(f"Successfully saved graph to {output_path}")
 
@@ -176,7 +185,8 @@ def save_metrics(metrics_df: pd.DataFrame, output_path: Path) -> None:
     # ディレクトリが存在しない場合は作成
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    metrics_df.to_csv(output_path, index=False)
+    # OSに依存しない改行コードで保存する（数値列のみのためクォートは発生しない）
+    metrics_df.to_csv(output_path, index=False, lineterminator="\n")
 
     logger.info(f"Successfully saved metrics to {output_path}")
 
@@ -3,6 +3,7 @@
 import argparse
 import logging
 import sys
+import zipfile
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -43,7 +44,10 @@ def parse_arguments(args: Optional[list[str]] = None) -> argparse.Namespace:
     parser.add_argument(
         "--keep-raw",
         action="store_true",
-        help="Keep raw downloaded files (default: delete after processing)",
+        help=(
+            "Keep the downloaded zip file in data/raw "
+            "(default: read it in memory without saving)"
+        ),
     )
 
     parser.add_argument(
@@ -80,8 +84,9 @@ def main() -> int:
         raw_dir = project_root / "data" / "raw"
         output_dir = project_root / args.output_dir
 
-        # Create directories
-        raw_dir.mkdir(parents=True, exist_ok=True)
+        # Create directories (raw_dir is only needed when keeping the zip file)
+        if args.keep_raw:
+            raw_dir.mkdir(parents=True, exist_ok=True)
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # Fixed output filenames
@@ -103,41 +108,41 @@ def main() -> int:
         # Generate timestamp for raw files
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
         zip_path = raw_dir / f"peps_{timestamp}.zip"
-        extract_dir = raw_dir / f"peps_extracted_{timestamp}"
 
         # Download PEP repository
         logger.info("Step 1/6: Downloading PEP repository...")
-        fetcher.download_repo(PEP_REPO_URL, zip_path)
-        logger.info(f"Downloaded to {zip_path}")
-
-        # Extract zip file
-        logger.info("Step 2/6: Extracting zip file...")
-        fetcher.extract_zip(zip_path, extract_dir)
-        logger.info(f"Extracted to {extract_dir}")
-
-        # Find and parse PEP files
-        logger.info("Step 3/6: Finding PEP files...")
-        pep_dir = extract_dir / "peps-main" / "peps"
-
-        if not pep_dir.exists():
-            possible_dirs = list(extract_dir.glob("*/peps"))
-            if possible_dirs:
-                pep_dir = possible_dirs[0]
-                logger.info(f"Found PEP directory: {pep_dir}")
+        zip_source: Path | zipfile.ZipFile
+        try:
+            if args.keep_raw:
+                zip_source = fetcher.download_repo(PEP_REPO_URL, zip_path)
+                logger.info(f"Downloaded to {zip_path}")
             else:
-                logger.error(f"Could not find peps directory in {extract_dir}")
-                return 1
-
-        pep_files = fetcher.get_pep_files(pep_dir)
-        logger.info(f"Found {len(pep_files)} PEP files")
-
-        logger.info("Parsing PEP metadata...")
-        pep_metadata = parser.parse_multiple_peps(pep_files)
+                # 生ファイルを残さない場合はディスクを経由せずメモリ上で読み込む
+                zip_source = fetcher.open_repo_stream(PEP_REPO_URL)
+        finally:
+            fetcher.close()
+
+        # Read PEP files directly from the zip file (no extraction to disk)
+        logger.info("Step 2/6: Reading PEP files from zip file...")
+        try:
+            pep_contents = list(fetcher.iter_pep_contents(zip_source))
+        finally:
+            if isinstance(zip_source, zipfile.ZipFile):
+                zip_source.close()
+
+        if not pep_contents:
+            logger.error(f"Could not find PEP files in {PEP_REPO_URL}")
+            return 1
+
+        logger.info(f"Found {len(pep_contents)} PEP files")
+
+        logger.info("Step 3/6: Parsing PEP metadata...")
+        pep_metadata = parser.parse_multiple_pep_contents(pep_contents)
         logger.info(f"Successfully parsed {len(pep_metadata)} PEPs")
 
         # Extract citations
         logger.info("Step 4/6: Extracting citations...")
-        citations_df = citation_extractor.extract_from_multiple_files(pep_files)
+        citations_df = citation_extractor.extract_from_multiple_contents(pep_contents)
         logger.info(f"Extracted {len(citations_df)} citation records")
 
         # ===== STEP 4.5: Detect citation changes =====
@@ -204,14 +209,10 @@ def main() -> int:
         # ===== STEP 9: Save metadata =====
         metadata_manager.save_metadata(new_metadata, metadata_path)
 
-        # ===== STEP 10: Clean up raw files =====
-        if not args.keep_raw:
-            logger.info("Cleaning up temporary files...")
-            fetcher.cleanup(zip_path)
-            fetcher.cleanup(extract_dir)
-            logger.info("Cleanup complete")
-        else:
-            logger.info("Keeping raw files (--keep-raw flag set)")
+        # ===== STEP 10: Report raw files =====
+        # --keep-raw未指定時はzipをメモリ上で扱うため、削除するファイルはない
+        if args.keep_raw:
+            logger.info(f"Keeping raw files (--keep-raw flag set): {zip_path}")
 
         # ===== Summary =====
         logger.info("\n" + "=" * 60)
@@ -6,6 +6,7 @@ This module provides functionality to extract PEP citations from RST content.
 import logging
 import re
 from collections import Counter
+from collections.abc import Iterable
 from pathlib import Path
 
 import pandas as pd
@@ -142,15 +143,33 @@ class CitationExtractor:
 
         Args:
             file_path: Path to the PEP RST file
+            exclude_self: Whether to exclude self-references
 
         Returns:
             Dictionary mapping citing PEP number to dictionary of cited PEP numbers
-            and their counts (excluding self-references)
+            and their counts (self-references are included only if
+            exclude_self is False)
         """
         # Read file content
         content = file_path.read_text(encoding="utf-8")
 
-        # Extract citing PEP number from the file
+        return self.extract_from_content(content, exclude_self)
+
+    def extract_from_content(
+        self, content: str, exclude_self: bool = True
+    ) -> dict[int, dict[int, int]]:
+        """Extract citations from PEP content with counts.
+
+        Args:
+            content: RST content of a PEP
+            exclude_self: Whether to exclude self-references
+
+        Returns:
+            Dictionary mapping citing PEP number to dictionary of cited PEP numbers
+            and their counts (self-references are included only if
+            exclude_self is False)
+        """
+        # Extract citing PEP number from the content
         citing_pep = self._parser.extract_pep_number(content)
 
         # Extract citations
@@ -170,27 +189,52 @@ class CitationExtractor:
         Returns:
             DataFrame with columns: citing, cited, count
         """
-        # Prepare list to collect all citation records
-        records = []
+        return self._to_dataframe(
+            self.extract_from_file(file_path) for file_path in file_paths
+        )
 
-        # Process each file
-        for file_path in file_paths:
-            # Extract citations from the file
-            file_citations = self.extract_from_file(file_path)
+    def extract_from_multiple_contents(
+        self, contents: list[tuple[str, bytes]]
+    ) -> pd.DataFrame:
+        """Extract citations from multiple raw PEP contents.
+
+        Args:
+            contents: List of (file name, raw content) tuples,
+                e.g. from PEPFetcher.iter_pep_contents()
 
+        Returns:
+            DataFrame with columns: citing, cited, count
+        """
+        return self._to_dataframe(
+            self.extract_from_content(data.decode("utf-8")) for _, data in contents
+        )
+
+    def _to_dataframe(
+        self, file_citations_iter: Iterable[dict[int, dict[int, int]]]
+    ) -> pd.DataFrame:
+        """Convert per-file citation counts to a citations DataFrame.
+
+        Args:
+            file_citations_iter: Iterable of per-file citation dictionaries
+
+        Returns:
+            DataFrame with columns: citing, cited, count
+        """
+        # Prepare list to collect all citation records as (citing, cited, count)
+        # tuples, avoiding a dict per row
+        records: list[tuple[int, int, int]] = []
+
+        # Process each file
+        for file_citations in file_citations_iter:
             # Convert to DataFrame records
             for citing_pep, citations in file_citations.items():
-                for cited_pep, count in citations.items():
-                    records.append(
-                        {"citing": citing_pep, "cited": cited_pep, "count": count}
-                    )
-
-        # Create DataFrame
-        if records:
-            df = pd.DataFrame(records)
-        else:
-            # Return empty DataFrame with correct columns
-            df = pd.DataFrame(columns=["citing", "cited", "count"])
+                records.extend(
+                    (citing_pep, cited_pep, count)
+                    for cited_pep, count in citations.items()
+                )
+
+        # Create DataFrame (an empty one still gets the correct columns)
+        df = pd.DataFrame(records, columns=["citing", "cited", "count"])
 
         # Ensure correct data types
         if len(df) > 0:
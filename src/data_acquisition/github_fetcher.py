@@ -1,23 +1,67 @@
 """GitHub fetcher for downloading and extracting PEP repository."""
 
+import io
 import logging
+import os
+import re
 import shutil
 import zipfile
-from pathlib import Path
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path, PurePosixPath
+from types import TracebackType
+from typing import BinaryIO, Self
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.data_acquisition.pep_parser import HEADER_READ_SIZE, read_header_block
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT = 60
+POOL_SIZE = 4
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.2
+# ダウンロード時の書き込み単位（1 MiB）
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# zip展開時のコピーバッファサイズ（1 MiB）
+EXTRACT_BUFFER_SIZE = 1024 * 1024
+# PEPファイル名のパターン（例: pep-0001.rst）
+PEP_FILENAME_PATTERN = re.compile(r"pep-(\d+)\.rst")
 
 
 class PEPFetcher:
     """Fetcher for downloading and extracting PEP files from GitHub."""
 
     def __init__(self):
-        """Initialize PEPFetcher."""
-        pass
+        """Initialize PEPFetcher with a pooled HTTP session."""
+        self.session = requests.Session()
+
+        # リトライ時も同じコネクションプールを再利用する
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=Retry(total=MAX_RETRIES, backoff_factor=RETRY_BACKOFF_FACTOR),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self.session.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
 
     def download_repo(
         self, url: str, output_path: Path, timeout: int = DEFAULT_TIMEOUT
@@ -35,26 +79,141 @@ class PEPFetcher:
 
         Raises:
             requests.RequestException: If download fails
+
+        Note:
+            The body is streamed into a temporary file next to output_path,
+            which is moved into place only after the download has completed.
+            A failed download never leaves a partial file at output_path.
         """
         logger.info(f"Downloading PEP repository from {url}")
 
+        partial_path = output_path.with_name(output_path.name + ".part")
+
         try:
-            response = requests.get(url, timeout=timeout)
-            response.raise_for_status()
+            with self._open_response(url, timeout) as response:
+                # Ensure parent directory exists
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+
+                with open(partial_path, "wb") as f:
+                    self._preallocate(f.fileno(), response)
+                    bytes_written = self._write_response(response, f)
+                    # 事前確保したサイズと実際のサイズが異なる場合に備えて切り詰める
+                    f.truncate()
+
+            os.replace(partial_path, output_path)
+        except BaseException:
+            # 途中まで書き込んだ（または事前確保した）ファイルを残さない
+            partial_path.unlink(missing_ok=True)
+            raise
+
+        logger.info(f"Downloaded {bytes_written} bytes to {output_path}")
+        return output_path
+
+    def open_repo_stream(
+        self, url: str, timeout: int = DEFAULT_TIMEOUT
+    ) -> zipfile.ZipFile:
+        """
+        Download PEP repository zip file from GitHub into memory.
 
-            # Ensure parent directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+        Args:
+            url: URL of the zip file to download
+            timeout: Timeout for the request in seconds (default: 60)
 
-            # Write content to file
-            output_path.write_bytes(response.content)
+        Returns:
+            Zip file backed by an in-memory buffer
 
-            logger.info(f"Downloaded {len(response.content)} bytes to {output_path}")
-            return output_path
+        Raises:
+            requests.RequestException: If download fails
+            zipfile.BadZipFile: If the downloaded content is not a valid zip file
 
+        Note:
+            Nothing is written to disk, so the archive is not written and
+            re-read through the page cache. Use download_repo to keep the file.
+        """
+        logger.info(f"Downloading PEP repository from {url}")
+
+        buffer = io.BytesIO()
+        with self._open_response(url, timeout) as response:
+            bytes_written = self._write_response(response, buffer)
+        buffer.seek(0)
+
+        logger.info(f"Downloaded {bytes_written} bytes into memory")
+        return zipfile.ZipFile(buffer, "r")
+
+    @contextmanager
+    def _open_response(self, url: str, timeout: int) -> Iterator[requests.Response]:
+        """
+        Open a streaming GET request and close it when done.
+
+        Args:
+            url: URL to request
+            timeout: Timeout for the request in seconds
+
+        Yields:
+            Streaming HTTP response with a successful status code
+
+        Raises:
+            requests.RequestException: If the request or streaming fails
+        """
+        try:
+            response = self.session.get(url, timeout=timeout, stream=True)
+            try:
+                response.raise_for_status()
+                yield response
+            finally:
+                response.close()
         except requests.RequestException as e:
             logger.error(f"Failed to download from {url}: {e}")
             raise
 
+    def _write_response(self, response: requests.Response, dst: BinaryIO) -> int:
+        """
+        Stream the response body into a binary file object in large chunks.
+
+        Args:
+            response: Streaming HTTP response
+            dst: Writable binary file object
+
+        Returns:
+            Number of bytes written
+        """
+        bytes_written = 0
+        for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+            dst.write(chunk)
+            bytes_written += len(chunk)
+        return bytes_written
+
+    def _preallocate(self, fd: int, response: requests.Response) -> None:
+        """
+        Pre-allocate the output file using the response's Content-Length.
+
+        Args:
+            fd: File descriptor of the output file
+            response: Streaming HTTP response
+
+        Note:
+            Skipped when the response is content-encoded (Content-Length is
+            then the compressed size), when the length is unknown, or on
+            platforms without os.posix_fallocate (e.g. macOS).
+        """
+        if not hasattr(os, "posix_fallocate"):
+            return
+        if response.headers.get("Content-Encoding", "identity") != "identity":
+            return
+
+        try:
+            size = int(response.headers.get("Content-Length") or 0)
+        except ValueError:
+            return
+        if size <= 0:
+            return
+
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError as e:
+            # ファイルシステムが対応していない場合は事前確保せずに続行する
+            logger.debug(f"Could not pre-allocate {size} bytes: {e}")
+
     def extract_zip(self, zip_path: Path, extract_to: Path) -> Path:
         """
         Extract zip file to specified directory with path traversal protection.
@@ -82,22 +241,22 @@ class PEPFetcher:
             # Validate all file paths before extraction (Zip Slip protection)
             with zipfile.ZipFile(zip_path, "r") as zf:
                 for member in zf.namelist():
-                    # Resolve the full path and check it's within extract_to
-                    member_path = (extract_to / member).resolve()
-
-                    # Check if the resolved path is within the extraction directory
-                    # Use os.sep to ensure proper path separator handling
-                    try:
-                        member_path.relative_to(extract_to_resolved)
-                    except ValueError:
-                        # relative_to() raises ValueError if member_path is not relative to extract_to_resolved
+                    # Resolve the full path and check it's within extract_to.
+                    # resolve() also follows symlinks that already exist under
+                    # extract_to, so a link pointing outside of it is caught too.
+                    # バックスラッシュはWindowsでは区切り文字になるため名前ごと拒否する
+                    member_path = (extract_to_resolved / member).resolve()
+                    if "\\" in member or not member_path.is_relative_to(
+                        extract_to_resolved
+                    ):
                         logger.error(f"Path traversal attempt detected: {member}")
                         raise ValueError(
                             f"Attempted path traversal in zip file: {member}"
                         )
 
                 # If all paths are safe, extract
-                zf.extractall(extract_to)
+                for info in zf.infolist():
+                    self._extract_member(zf, info, extract_to)
 
             logger.info(f"Successfully extracted to {extract_to}")
             return extract_to
@@ -106,6 +265,28 @@ class PEPFetcher:
             logger.error(f"Invalid zip file {zip_path}: {e}")
             raise
 
+    def _extract_member(
+        self, zf: zipfile.ZipFile, info: zipfile.ZipInfo, extract_to: Path
+    ) -> None:
+        """
+        Extract a single zip entry using a large copy buffer.
+
+        Args:
+            zf: Open zip file containing the entry
+            info: Entry to extract (must already be validated against path traversal)
+            extract_to: Directory where to extract the entry
+        """
+        target = extract_to / info.filename
+
+        if info.is_dir():
+            target.mkdir(parents=True, exist_ok=True)
+            return
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+
+        with zf.open(info) as src, open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst, EXTRACT_BUFFER_SIZE)
+
     def get_pep_files(self, repo_path: Path) -> list[Path]:
         """
         Get list of PEP RST files from the repository directory.
@@ -121,25 +302,143 @@ class PEPFetcher:
         """
         logger.info(f"Searching for PEP files in {repo_path}")
 
-        # Find all pep-*.rst files
-        pep_files = []
-        for file_path in repo_path.glob("pep-*.rst"):
-            # Extract PEP number from filename (e.g., pep-0001.rst -> 1)
-            try:
-                pep_number = int(file_path.stem.split("-")[1])
+        # Find all pep-*.rst files.
+        # os.scandir reuses the d_type returned by readdir, so only matching
+        # entries are turned into Path objects and no per-file stat is needed.
+        numbered_files = []
+        with os.scandir(repo_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith("pep-") and name.endswith(".rst")):
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+
+                pep_number = self._pep_number_from_filename(name)
+                if pep_number is None:
+                    logger.warning(f"Skipping file with invalid name: {entry.path}")
+                    continue
+
                 # Exclude PEP 0 (table of contents)
                 if pep_number != 0:
-                    pep_files.append(file_path)
-            except (IndexError, ValueError):
-                logger.warning(f"Skipping file with invalid name: {file_path}")
-                continue
+                    numbered_files.append((pep_number, Path(entry.path)))
 
         # Sort by PEP number
-        pep_files.sort(key=lambda p: int(p.stem.split("-")[1]))
+        numbered_files.sort(key=lambda item: item[0])
+        pep_files = [file_path for _, file_path in numbered_files]
 
         logger.info(f"Found {len(pep_files)} PEP files")
         return pep_files
 
+    def iter_pep_contents(
+        self, source: Path | zipfile.ZipFile, header_only: bool = False
+    ) -> Iterator[tuple[str, bytes]]:
+        """
+        Iterate over PEP RST files directly inside the repository zip file.
+
+        Args:
+            source: Path to the zip file (opened and closed here), or an
+                already open zipfile.ZipFile (e.g. from open_repo_stream),
+                which is left open
+            header_only: If True, only decompress each file's header block
+                (enough for PEPParser.parse_pep_bytes, but not for citations)
+
+        Yields:
+            Tuples of (member name, raw file content) sorted by PEP number
+            (excluding PEP 0)
+
+        Raises:
+            zipfile.BadZipFile: If the file is not a valid zip file
+
+        Note:
+            Only pep-*.rst files located directly in a "peps" directory are
+            yielded. Nothing is written to disk, so no Zip Slip check is needed.
+        """
+        logger.info(f"Reading PEP files from {source}")
+
+        zip_context: AbstractContextManager[zipfile.ZipFile]
+        if isinstance(source, zipfile.ZipFile):
+            zip_context = nullcontext(source)
+        else:
+            zip_context = zipfile.ZipFile(source, "r")
+
+        try:
+            with zip_context as zf:
+                numbered_infos = []
+                for info in zf.infolist():
+                    member = PurePosixPath(info.filename)
+                    if info.is_dir() or member.parent.name != "peps":
+                        continue
+                    if not (
+                        member.name.startswith("pep-") and member.name.endswith(".rst")
+                    ):
+                        continue
+
+                    pep_number = self._pep_number_from_filename(member.name)
+                    if pep_number is None:
+                        logger.warning(
+                            f"Skipping file with invalid name: {info.filename}"
+                        )
+                        continue
+
+                    # Exclude PEP 0 (table of contents)
+                    if pep_number != 0:
+                        numbered_infos.append((pep_number, info))
+
+                # Sort by PEP number
+                numbered_infos.sort(key=lambda item: item[0])
+                logger.info(f"Found {len(numbered_infos)} PEP files")
+
+                for _, info in numbered_infos:
+                    if header_only:
+                        yield info.filename, self.read_pep_header(zf, info)
+                    else:
+                        yield info.filename, zf.read(info)
+
+        except zipfile.BadZipFile as e:
+            logger.error(f"Invalid zip file {source}: {e}")
+            raise
+
+    def read_pep_header(
+        self,
+        zf: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        nbytes: int = HEADER_READ_SIZE,
+    ) -> bytes:
+        """
+        Read only the header block of a PEP file inside a zip file.
+
+        Args:
+            zf: Open zip file containing the entry
+            info: Entry of the PEP file
+            nbytes: Number of bytes to decompress at a time
+
+        Returns:
+            Raw content up to and including the first blank line
+            (or the whole file if it has no blank line)
+
+        Note:
+            Decompression stops as soon as the header block has been read,
+            so the body of the PEP is (mostly) never inflated.
+        """
+        with zf.open(info) as src:
+            return read_header_block(src, nbytes)
+
+    def _pep_number_from_filename(self, name: str) -> int | None:
+        """
+        Extract the PEP number from a PEP file name.
+
+        Args:
+            name: File name such as "pep-0001.rst"
+
+        Returns:
+            PEP number as integer, or None if the name is not a valid PEP file name
+        """
+        match = PEP_FILENAME_PATTERN.fullmatch(name)
+        if match is None:
+            return None
+        return int(match.group(1))
+
     def cleanup(self, path: Path) -> None:
         """
         Remove temporary files and directories.
@@ -159,8 +458,37 @@ class PEPFetcher:
                 path.unlink()
                 logger.info(f"Removed file: {path}")
             elif path.is_dir():
-                shutil.rmtree(path)
+                self._remove_tree(path)
                 logger.info(f"Removed directory: {path}")
         except Exception as e:
             logger.error(f"Failed to clean up {path}: {e}")
             raise
+
+    def _remove_tree(self, path: Path) -> None:
+        """
+        Remove a directory tree with an iterative os.scandir walk.
+
+        Args:
+            path: Path to the directory to remove
+
+        Note:
+            Symlinks are unlinked rather than followed, so nothing outside
+            the tree is ever removed.
+        """
+        stack = [os.fspath(path)]
+        dirs = []
+
+        # ファイルを削除しながらディレクトリを収集する
+        while stack:
+            current = stack.pop()
+            dirs.append(current)
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        os.unlink(entry.path)
+
+        # 深い階層から順にディレクトリを削除する
+        for directory in reversed(dirs):
+            os.rmdir(directory)
@@ -4,33 +4,95 @@ import logging
 import re
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Optional
+from typing import IO, Optional
 
 import pandas as pd
 
 
 logger = logging.getLogger(__name__)
 
+# ヘッダーのみ読み込む際の読み込み単位（バイト）
+HEADER_READ_SIZE = 2048
+# ヘッダーブロックの終わり（空白文字のみの行。CRLF の空行も含む）
+# ヘッダーの終わりの判定はすべてこのパターンに統一する
+HEADER_END_PATTERN = re.compile(rb"\n[ \t\r\f\v]*\n")
+_HEADER_END_PATTERN_STR = re.compile(HEADER_END_PATTERN.pattern.decode("ascii"))
 
-@dataclass
+
+def find_header_end(data: bytes) -> Optional[int]:
+    """
+    Find the end of the header block in raw PEP content.
+
+    Args:
+        data: Raw content (or a prefix of it) of a PEP RST file
+
+    Returns:
+        Offset just past the first whitespace-only line that follows the
+        header, or None if no such line is contained in data.
+        Leading blank lines are not treated as the end of the header.
+    """
+    start = len(data) - len(data.lstrip())
+    match = HEADER_END_PATTERN.search(data, start)
+    return match.end() if match else None
+
+
+def read_header_block(src: IO[bytes], nbytes: int = HEADER_READ_SIZE) -> bytes:
+    """
+    Read raw PEP content from a stream only up to the end of the header block.
+
+    Args:
+        src: Binary stream positioned at the start of the PEP file
+        nbytes: Number of bytes to read at a time
+
+    Returns:
+        Raw content up to and including the first blank line
+        (or the whole stream if it has no blank line)
+    """
+    data = src.read(nbytes)
+    end = find_header_end(data)
+
+    # ヘッダーが読み込んだ範囲に収まらない場合は続きを読む
+    while end is None:
+        chunk = src.read(nbytes)
+        if not chunk:
+            return data
+        data += chunk
+        end = find_header_end(data)
+
+    return data[:end]
+
+
+@dataclass(frozen=True, slots=True)
 class PEPMetadata:
-    """Metadata extracted from a PEP document."""
+    """Metadata extracted from a PEP document.
+
+    Instances are frozen and multi-valued fields are tuples, so a parse
+    result can be passed around without callers mutating each other's data.
+    """
 
     pep_number: int
     title: str
     status: str
     type: str
     created: Optional[str]  # ISO format date string, or None if empty
-    authors: list[str]
-    topic: Optional[list[str]] = None
-    requires: Optional[list[int]] = None
-    replaces: Optional[list[int]] = None
+    authors: tuple[str, ...]
+    topic: Optional[tuple[str, ...]] = None
+    requires: Optional[tuple[int, ...]] = None
+    replaces: Optional[tuple[int, ...]] = None
     python_version: Optional[str] = None
 
 
 class PEPParser:
     """Parser for extracting metadata from PEP RST files."""
 
+    # Compiled once at class load time and shared by all instances
+    _EMAIL_PATTERN = re.compile(r"<[^>]+>")
+
+    def __init__(self) -> None:
+        """Initialize PEPParser."""
+        # 直近にパースしたヘッダーブロック: (content, headers)
+        self._headers_cache: Optional[tuple[str, dict[str, Optional[str]]]] = None
+
     def extract_pep_number(self, content: str) -> int:
         """
         Extract PEP number from RST metadata (the value after "PEP:").
@@ -48,13 +110,31 @@ class PEPParser:
         if pep_value is None or not pep_value.strip():
             raise ValueError("Missing or empty 'PEP:' field in document")
 
-        try:
-            pep_number = int(pep_value.strip())
-            return pep_number
-        except ValueError as e:
+        pep_str = pep_value.strip()
+        if not self._is_decimal(pep_str):
             raise ValueError(
                 f"Could not parse PEP number from 'PEP:' field (got: {pep_value!r})"
-            ) from e
+            )
+
+        return int(pep_str)
+
+    @staticmethod
+    def _is_decimal(value: str) -> bool:
+        """
+        Check whether a string consists only of ASCII digits.
+
+        Args:
+            value: String to check (already stripped)
+
+        Returns:
+            True if int(value) is a plain non-negative decimal integer
+
+        Note:
+            str.isdigit() alone also accepts non-ASCII digits such as "²",
+            and int() would accept "+1", " 1" or "1_000", so both checks
+            are combined instead of relying on int() raising.
+        """
+        return value.isascii() and value.isdigit()
 
     def parse_header_field(self, content: str, field_name: str) -> Optional[str]:
         """
@@ -70,36 +150,71 @@ class PEPParser:
         Note:
             Handles multi-line field values that are indented with spaces.
         """
-        lines = content.split("\n")
-        field_value_lines = []
-        in_field = False
-        field_pattern = re.compile(rf"^{re.escape(field_name)}:\s*(.*)$", re.IGNORECASE)
-
-        for i, line in enumerate(lines):
-            # Check if this line starts the field we're looking for
-            match = field_pattern.match(line)
-            if match:
-                in_field = True
-                # Get the value on the same line as the field name
-                value = match.group(1).strip()
-                if value:
-                    field_value_lines.append(value)
-                continue
+        return self._parse_headers(content).get(field_name.lower())
+
+    def _parse_headers(self, content: str) -> dict[str, Optional[str]]:
+        """
+        Parse the RFC 2822 style header block of RST content in a single pass.
+
+        Args:
+            content: The RST file content
+
+        Returns:
+            Dictionary mapping lower-cased field names to their values.
+            Multi-line values are joined with a single space, and fields
+            without a value map to None.
+
+        Note:
+            The header block ends at the first blank line. The result for the
+            most recent content is cached, so repeated field lookups on the
+            same document do not re-scan it.
+        """
+        if self._headers_cache is not None and self._headers_cache[0] is content:
+            return self._headers_cache[1]
+
+        headers: dict[str, Optional[str]] = {}
+        field_name: Optional[str] = None
+        field_value_lines: list[str] = []
+
+        def _store_field() -> None:
+            # 同じフィールドが複数回現れた場合は最初の値を優先する
+            if field_name is not None and field_name not in headers:
+                headers[field_name] = (
+                    " ".join(field_value_lines) if field_value_lines else None
+                )
+
+        # 先頭の空行を除き、最初の空行までをヘッダーブロックとして切り出す
+        # (本文全体を行分割しないようにする)
+        text = content.lstrip()
+        header_end = _HEADER_END_PATTERN_STR.search(text)
+        header_block = text[: header_end.start()] if header_end else text
 
-            # If we're in a field, check for continuation lines
-            if in_field:
-                # Continuation lines start with whitespace
-                if line and (line[0] == " " or line[0] == "\t"):
+        for line in header_block.split("\n"):
+            if not line.strip():
+                break
+
+            # Continuation lines start with whitespace
+            if line[0] == " " or line[0] == "\t":
+                if field_name is not None:
                     field_value_lines.append(line.strip())
-                else:
-                    # We've reached the end of this field
-                    break
+                continue
+
+            _store_field()
+            # 最初のコロンでフィールド名と値に分ける（strip は各1回のみ）
+            name, sep, value = line.partition(":")
+            name = name.strip()
+            if sep and name and " " not in name:
+                field_name = name.lower()
+                value = value.strip()
+                field_value_lines = [value] if value else []
+            else:
+                field_name = None
+                field_value_lines = []
 
-        if not field_value_lines:
-            return None
+        _store_field()
 
-        # Join multi-line values
-        return " ".join(field_value_lines)
+        self._headers_cache = (content, headers)
+        return headers
 
     def _parse_authors(self, author_string: str) -> list[str]:
         """
@@ -116,7 +231,7 @@ class PEPParser:
             -> ["Barry Warsaw", "Jeremy Hylton"]
         """
         # Remove email addresses (text in angle brackets)
-        author_string = re.sub(r"<[^>]+>", "", author_string)
+        author_string = self._EMAIL_PATTERN.sub("", author_string)
 
         # Split by comma
         authors = [author.strip() for author in author_string.split(",")]
@@ -141,17 +256,28 @@ class PEPParser:
             "Typing" -> ["Typing"]
             "" -> []
         """
-        # 空文字列の場合は空リストを返す
-        if not topic_string or not topic_string.strip():
-            return []
+        return self._split_csv(topic_string)
 
-        # カンマで分割
-        topics = [topic.strip() for topic in topic_string.split(",")]
+    def _split_csv(self, value: str) -> list[str]:
+        """
+        Split a comma-separated header value into stripped, non-empty items.
 
-        # 空文字列を除外
-        topics = [topic for topic in topics if topic]
+        Args:
+            value: Comma-separated string
 
-        return topics
+        Returns:
+            List of items with surrounding whitespace removed
+
+        Example:
+            "Governance, Packaging" -> ["Governance", "Packaging"]
+            "440, , 508" -> ["440", "508"]
+        """
+        # 空文字列（フィールドなし）の場合は分割せずに空リストを返す
+        if not value or value.isspace():
+            return []
+
+        # 各要素のstripは1回だけ行い、空文字列を除外する
+        return [item for item in map(str.strip, value.split(",")) if item]
 
     def _parse_pep_numbers(self, pep_string: str, field_name: str) -> list[int]:
         """
@@ -172,27 +298,16 @@ class PEPParser:
             "440, 508, 518" -> [440, 508, 518]
             "" -> []
         """
-        # 空文字列の場合は空リストを返す
-        if not pep_string or not pep_string.strip():
-            return []
-
-        # カンマで分割し、空文字列を除外
-        pep_strings = [pep.strip() for pep in pep_string.split(",") if pep.strip()]
-
         # 各PEP番号を整数に変換
         pep_numbers = []
-        for pep_str in pep_strings:
-            try:
-                pep_num = int(pep_str)
-                # PEP番号は正の整数でなければならない
-                if pep_num <= 0:
-                    raise ValueError("non-positive PEP number")
-                pep_numbers.append(pep_num)
-            except ValueError as e:
+        for pep_str in self._split_csv(pep_string):
+            # PEP番号は正の整数でなければならない
+            if not self._is_decimal(pep_str) or int(pep_str) <= 0:
                 raise ValueError(
                     f"Invalid PEP number in {field_name} field: '{pep_str}' "
                     f"(must be a positive integer)"
-                ) from e
+                )
+            pep_numbers.append(int(pep_str))
 
         return pep_numbers
 
@@ -252,45 +367,77 @@ class PEPParser:
         """
         logger.info(f"Parsing PEP file: {file_path}")
 
-        # Read file content
+        # Read only up to the end of the header block
         try:
-            content = file_path.read_text(encoding="utf-8")
+            with open(file_path, "rb") as f:
+                header_bytes = read_header_block(f)
         except Exception as e:
             logger.error(f"Failed to read file {file_path}: {e}")
             raise
 
+        return self.parse_pep_bytes(str(file_path), header_bytes)
+
+    def parse_pep_bytes(self, name: str, data: bytes) -> PEPMetadata:
+        """
+        Parse raw PEP RST content and extract metadata.
+
+        Args:
+            name: Name of the PEP file (used in log and error messages)
+            data: Raw content of the PEP RST file
+
+        Returns:
+            PEPMetadata object containing extracted metadata
+
+        Raises:
+            ValueError: If required fields are missing or file is malformed
+            KeyError: If required fields cannot be found
+        """
+        # Decode only the header block.
+        # Metadata lives entirely in the header, so the (often large) body
+        # does not need to be decoded.
+        try:
+            end = find_header_end(data)
+            header_bytes = data[:end] if end is not None else data
+            content = header_bytes.decode("utf-8")
+        except UnicodeDecodeError as e:
+            logger.error(f"Failed to decode file {name}: {e}")
+            raise
+
         # Extract PEP number from document metadata (PEP: field)
         pep_number = self.extract_pep_number(content)
 
+        # Parse the header block once and look up each field
+        headers = self._parse_headers(content)
+
         # Extract required fields
-        title = self.parse_header_field(content, "Title")
-        status = self.parse_header_field(content, "Status")
-        pep_type = self.parse_header_field(content, "Type")
-        created = self.parse_header_field(content, "Created")
-        author_string = self.parse_header_field(content, "Author")
+        title = headers.get("title")
+        status = headers.get("status")
+        pep_type = headers.get("type")
+        created = headers.get("created")
+        author_string = headers.get("author")
 
         # Extract optional fields
-        topic_string = self.parse_header_field(content, "Topic")
-        requires_string = self.parse_header_field(content, "Requires")
-        replaces_string = self.parse_header_field(content, "Replaces")
-        python_version = self.parse_header_field(content, "Python-Version")
+        topic_string = headers.get("topic")
+        requires_string = headers.get("requires")
+        replaces_string = headers.get("replaces")
+        python_version = headers.get("python-version")
 
         # Validate required fields
         if not title:
             raise ValueError(
-                f"Missing required field 'Title' in PEP {pep_number} ({file_path})"
+                f"Missing required field 'Title' in PEP {pep_number} ({name})"
             )
         if not status:
             raise ValueError(
-                f"Missing required field 'Status' in PEP {pep_number} ({file_path})"
+                f"Missing required field 'Status' in PEP {pep_number} ({name})"
             )
         if not pep_type:
             raise ValueError(
-                f"Missing required field 'Type' in PEP {pep_number} ({file_path})"
+                f"Missing required field 'Type' in PEP {pep_number} ({name})"
             )
         if not author_string:
             raise ValueError(
-                f"Missing required field 'Author' in PEP {pep_number} ({file_path})"
+                f"Missing required field 'Author' in PEP {pep_number} ({name})"
             )
 
         # Parse authors
@@ -315,7 +462,7 @@ class PEPParser:
             except ValueError as e:
                 # Requires フィールドのパースエラーはPEP全体のエラーとして扱う
                 raise ValueError(
-                    f"Failed to parse Requires field in PEP {pep_number} ({file_path}): {e}"
+                    f"Failed to parse Requires field in PEP {pep_number} ({name}): {e}"
                 ) from e
 
         # Parse replaced PEPs (optional field)
@@ -329,7 +476,7 @@ class PEPParser:
             except ValueError as e:
                 # Replaces フィールドのパースエラーはPEP全体のエラーとして扱う
                 raise ValueError(
-                    f"Failed to parse Replaces field in PEP {pep_number} ({file_path}): {e}"
+                    f"Failed to parse Replaces field in PEP {pep_number} ({name}): {e}"
                 ) from e
 
         # Handle empty Created field
@@ -342,10 +489,10 @@ class PEPParser:
             status=status,
             type=pep_type,
             created=created,
-            authors=authors,
-            topic=topic,
-            requires=requires,
-            replaces=replaces,
+            authors=tuple(authors),
+            topic=tuple(topic) if topic is not None else None,
+            requires=tuple(requires) if requires is not None else None,
+            replaces=tuple(replaces) if replaces is not None else None,
             python_version=python_version,
         )
 
@@ -360,13 +507,14 @@ class PEPParser:
             file_paths: List of paths to PEP RST files
 
         Returns:
-            List of PEPMetadata objects for successfully parsed files
+            List of PEPMetadata objects for successfully parsed files,
+            in the same order as file_paths
 
         Note:
             If a file fails to parse, it will be skipped and logged as an error.
             The parsing continues with the remaining files.
         """
-        results = []
+        results: list[PEPMetadata] = []
         errors = 0
 
         for file_path in file_paths:
@@ -382,6 +530,39 @@ class PEPParser:
 
         return results
 
+    def parse_multiple_pep_contents(
+        self, contents: list[tuple[str, bytes]]
+    ) -> list[PEPMetadata]:
+        """
+        Parse multiple raw PEP contents and return a list of metadata.
+
+        Args:
+            contents: List of (file name, raw content) tuples,
+                e.g. from PEPFetcher.iter_pep_contents()
+
+        Returns:
+            List of PEPMetadata objects for successfully parsed contents,
+            in the same order as contents
+
+        Note:
+            Behaves like parse_multiple_peps() but never touches the filesystem.
+        """
+        results: list[PEPMetadata] = []
+        errors = 0
+
+        for name, data in contents:
+            try:
+                metadata = self.parse_pep_bytes(name, data)
+                results.append(metadata)
+            except Exception as e:
+                logger.error(f"Failed to parse {name}: {e}")
+                errors += 1
+                continue
+
+        logger.info(f"Parsed {len(results)} PEPs successfully, {errors} files failed")
+
+        return results
+
     def save_to_csv(self, metadata_list: list[PEPMetadata], output_path: Path) -> None:
         """
         Save PEP metadata to CSV file.
@@ -403,25 +584,25 @@ class PEPParser:
         # DataFrameを作成
         df = pd.DataFrame([asdict(m) for m in metadata_list])
 
-        # リストフィールドをセミコロン区切りの文字列に変換
+        # タプルフィールドをセミコロン区切りの文字列に変換
         if "authors" in df.columns:
             df["authors"] = df["authors"].apply(
-                lambda x: "; ".join(x) if isinstance(x, list) else x
+                lambda x: "; ".join(x) if isinstance(x, tuple) else x
             )
         if "topic" in df.columns:
             df["topic"] = df["topic"].apply(
-                lambda x: "; ".join(x) if isinstance(x, list) and x else ""
+                lambda x: "; ".join(x) if isinstance(x, tuple) and x else ""
             )
         if "requires" in df.columns:
             df["requires"] = df["requires"].apply(
                 lambda x: (
-                    "; ".join(str(r) for r in x) if isinstance(x, list) and x else ""
+                    "; ".join(str(r) for r in x) if isinstance(x, tuple) and x else ""
                 )
             )
         if "replaces" in df.columns:
             df["replaces"] = df["replaces"].apply(
                 lambda x: (
-                    "; ".join(str(r) for r in x) if isinstance(x, list) and x else ""
+                    "; ".join(str(r) for r in x) if isinstance(x, tuple) and x else ""
                 )
             )
 
@@ -3,19 +3,32 @@
 import hashlib
 from pathlib import Path
 
+# metadata.jsonに保存済みのハッシュと比較するため、既定はSHA256のまま
+# （hashlibのSHA256はOpenSSL実装で、対応CPUではSHA拡張命令が使われる）
+DEFAULT_HASH_ALGORITHM = "sha256"
 
-def calculate_file_hash(file_path: Path) -> str:
+
+def calculate_file_hash(
+    file_path: Path, algorithm: str = DEFAULT_HASH_ALGORITHM
+) -> str:
     """
-    Calculate SHA256 hash of a file.
+    Calculate the hash of a file (SHA256 by default).
 
     Args:
         file_path: Path to the file
+        algorithm: Name of a hashlib algorithm (e.g. "sha256", "blake2b").
+            Defaults to DEFAULT_HASH_ALGORITHM ("sha256")
 
     Returns:
-        Hexadecimal string of the SHA256 hash (64 characters)
+        Hexadecimal string of the hash (64 characters for SHA256)
 
     Raises:
         FileNotFoundError: If the file doesn't exist
+        ValueError: If the algorithm is not supported by hashlib
+
+    Note:
+        The hashes are stored in metadata.json, so changing the algorithm
+        makes the next run report the data as changed.
 
     Examples:
         >>> from pathlib import Path
@@ -27,11 +40,6 @@ def calculate_file_hash(file_path: Path) -> str:
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    sha256 = hashlib.sha256()
-
-    # メモリ効率的にファイルを読み込む（4KBずつ）
+    # 読み込みとハッシュ計算のループをC実装に任せる（Python 3.11+）
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            sha256.update(chunk)
-
-    return sha256.hexdigest()
+        return hashlib.file_digest(f, algorithm).hexdigest()
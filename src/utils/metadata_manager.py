@@ -25,8 +25,8 @@ class MetadataManager:
             logger.info(f"Metadata file not found: {path}. Returning empty dict.")
             return {}
 
-        with open(path, "r", encoding="utf-8") as f:
-            metadata = json.load(f)
+        # 一括で読み込んでからデコードする（json.loadsはUTF-8のbytesを直接受け付ける）
+        metadata = json.loads(path.read_bytes())
 
         logger.info(f"Loaded metadata from {path}")
         return metadata
@@ -42,9 +42,9 @@ class MetadataManager:
         # ディレクトリが存在しない場合は作成
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
-            f.write("\n")  # 末尾改行を追加
+        # 一括でシリアライズし、1回の書き込みで保存する（末尾改行を追加）
+        content = json.dumps(metadata, indent=2, ensure_ascii=False) + "\n"
+        path.write_text(content, encoding="utf-8")
 
         logger.info(f"Saved metadata to {path}")
 
@@ -4,8 +4,11 @@ from pathlib import Path
 
 import pytest
 
+# テストデータのディレクトリ（インポート時に一度だけ解決する）
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_data_dir():
     """サンプルデータディレクトリのパスを返す"""
-    return Path(__file__).parent / "fixtures"
+    return FIXTURES_DIR
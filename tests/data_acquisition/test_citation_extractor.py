@@ -1,7 +1,5 @@
 """Tests for citation extractor module."""
 
-from pathlib import Path
-
 import pandas as pd
 import pytest
 
@@ -11,16 +9,11 @@ from src.data_acquisition.citation_extractor import CitationExtractor
 class TestCitationExtractor:
     """Test cases for CitationExtractor class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def extractor(self):
-        """Create a CitationExtractor instance for testing."""
+        """Create a CitationExtractor instance shared by the whole test session."""
         return CitationExtractor()
 
-    @pytest.fixture
-    def fixtures_dir(self):
-        """Get the fixtures directory path."""
-        return Path(__file__).parent.parent / "fixtures"
-
     # Phase 2: Basic citation extraction - :pep: pattern tests (Red)
 
     def test_extract_single_pep_role_citation(self, extractor):
@@ -202,9 +195,9 @@ Content here."""
 
     # Phase 4: File-based citation extraction tests (Red)
 
-    def test_extract_from_file(self, extractor, fixtures_dir):
+    def test_extract_from_file(self, extractor, sample_data_dir):
         """Test extracting citations from a file."""
-        file_path = fixtures_dir / "pep-with-citations.rst"
+        file_path = sample_data_dir / "pep-with-citations.rst"
         result = extractor.extract_from_file(file_path)
 
         # Expected citations from pep-with-citations.rst (PEP 9999):
@@ -220,9 +213,9 @@ Content here."""
         for pep in expected_peps:
             assert result[9999][pep] >= 1
 
-    def test_exclude_self_reference(self, extractor, fixtures_dir):
+    def test_exclude_self_reference(self, extractor, sample_data_dir):
         """Test that self-references are excluded from citations."""
-        file_path = fixtures_dir / "pep-0008.rst"
+        file_path = sample_data_dir / "pep-0008.rst"
         result = extractor.extract_from_file(file_path)
 
         # PEP 8 should not cite itself even if "PEP 8" appears in the text
@@ -274,11 +267,11 @@ See https://peps.python.org/pep-0008/ for details.
 
     # Phase 6: Multiple file processing tests (Red)
 
-    def test_extract_from_multiple_files(self, extractor, fixtures_dir):
+    def test_extract_from_multiple_files(self, extractor, sample_data_dir):
         """Test extracting citations from multiple files."""
         file_paths = [
-            fixtures_dir / "pep-with-citations.rst",
-            fixtures_dir / "pep-0008.rst",
+            sample_data_dir / "pep-with-citations.rst",
+            sample_data_dir / "pep-0008.rst",
         ]
         result = extractor.extract_from_multiple_files(file_paths)
 
@@ -295,9 +288,22 @@ See https://peps.python.org/pep-0008/ for details.
         pep_9999_citations = result[result["citing"] == 9999]
         assert len(pep_9999_citations) > 0
 
-    def test_dataframe_structure(self, extractor, fixtures_dir):
+    def test_extract_from_multiple_contents(self, extractor, sample_data_dir):
+        """Test that raw contents give the same result as the files."""
+        file_paths = [
+            sample_data_dir / "pep-with-citations.rst",
+            sample_data_dir / "pep-0008.rst",
+        ]
+        contents = [(path.name, path.read_bytes()) for path in file_paths]
+
+        result = extractor.extract_from_multiple_contents(contents)
+        expected = extractor.extract_from_multiple_files(file_paths)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_dataframe_structure(self, extractor, sample_data_dir):
         """Test that the DataFrame has correct structure."""
-        file_paths = [fixtures_dir / "pep-with-citations.rst"]
+        file_paths = [sample_data_dir / "pep-with-citations.rst"]
         result = extractor.extract_from_multiple_files(file_paths)
 
         # Check column names
@@ -324,10 +330,10 @@ See https://peps.python.org/pep-0008/ for details.
 
     # Phase 7: CSV output tests (Red)
 
-    def test_save_to_csv(self, extractor, fixtures_dir, tmp_path):
+    def test_save_to_csv(self, extractor, sample_data_dir, tmp_path):
         """Test saving citations to CSV file with sorted order."""
         # Extract citations from a file
-        file_paths = [fixtures_dir / "pep-with-citations.rst"]
+        file_paths = [sample_data_dir / "pep-with-citations.rst"]
         df = extractor.extract_from_multiple_files(file_paths)
 
         # Save to CSV
@@ -354,10 +360,10 @@ See https://peps.python.org/pep-0008/ for details.
             else:
                 assert current_row["citing"] < next_row["citing"]
 
-    def test_csv_format(self, extractor, fixtures_dir, tmp_path):
+    def test_csv_format(self, extractor, sample_data_dir, tmp_path):
         """Test CSV file format with sorted order."""
         # Create a simple DataFrame
-        file_paths = [fixtures_dir / "pep-with-citations.rst"]
+        file_paths = [sample_data_dir / "pep-with-citations.rst"]
         df = extractor.extract_from_multiple_files(file_paths)
 
         # Save to CSV
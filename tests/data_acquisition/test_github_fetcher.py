@@ -18,7 +18,8 @@ class TestPEPFetcher:
     @pytest.fixture
     def fetcher(self):
         """Create a PEPFetcher instance for testing."""
-        return PEPFetcher()
+        with PEPFetcher() as fetcher:
+            yield fetcher
 
     @pytest.fixture
     def temp_dir(self):
@@ -26,26 +27,18 @@ class TestPEPFetcher:
         with tempfile.TemporaryDirectory() as tmpdir:
             yield Path(tmpdir)
 
-    @pytest.fixture
-    def sample_zip(self, temp_dir):
-        """Create a sample zip file with mock PEP files."""
-        # Create a temporary directory structure
-        pep_dir = temp_dir / "peps-main" / "peps"
-        pep_dir.mkdir(parents=True)
-
-        # Create sample PEP files
-        (pep_dir / "pep-0001.rst").write_text("PEP: 1\nTitle: Test PEP")
-        (pep_dir / "pep-0008.rst").write_text("PEP: 8\nTitle: Style Guide")
-        (pep_dir / "pep-0020.rst").write_text("PEP: 20\nTitle: Zen of Python")
-        (pep_dir / "README.md").write_text("# README")  # Non-PEP file
-
-        # Create zip file
+    @pytest.fixture(scope="module")
+    def sample_zip(self, tmp_path_factory):
+        """Create a sample zip file with mock PEP files (built once per module)."""
+        temp_dir = tmp_path_factory.mktemp("sample_zip")
+
+        # Write the mock PEP files straight into the zip file
         zip_path = temp_dir / "test.zip"
-        with zipfile.ZipFile(zip_path, "w") as zf:
-            for file in pep_dir.rglob("*"):
-                if file.is_file():
-                    arcname = file.relative_to(temp_dir)
-                    zf.write(file, arcname)
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("peps-main/peps/pep-0001.rst", "PEP: 1\nTitle: Test PEP")
+            zf.writestr("peps-main/peps/pep-0008.rst", "PEP: 8\nTitle: Style Guide")
+            zf.writestr("peps-main/peps/pep-0020.rst", "PEP: 20\nTitle: Zen of Python")
+            zf.writestr("peps-main/peps/README.md", "# README")  # Non-PEP file
 
         return zip_path
 
@@ -54,13 +47,16 @@ class TestPEPFetcher:
         url = PEP_REPO_URL
         output_path = temp_dir / "peps.zip"
 
-        # Mock the requests.get call
+        # Mock the session.get call
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.content = b"fake zip content"
+        mock_response.headers = {"Content-Length": "16"}
+        mock_response.iter_content = Mock(return_value=[b"fake zip ", b"content"])
         mock_response.raise_for_status = Mock()
 
-        with patch("requests.get", return_value=mock_response) as mock_get:
+        with patch.object(
+            fetcher.session, "get", return_value=mock_response
+        ) as mock_get:
             result = fetcher.download_repo(url, output_path)
 
             # Verify the download was called correctly
@@ -72,17 +68,103 @@ class TestPEPFetcher:
             assert output_path.exists()
             assert output_path.read_bytes() == b"fake zip content"
 
+            # The response should be streamed and closed
+            assert mock_get.call_args[1]["stream"] is True
+            mock_response.close.assert_called_once()
+
+    def test_download_truncates_encoded_content(self, fetcher, temp_dir):
+        """Test that a Content-Length mismatch never leaves trailing bytes."""
+        output_path = temp_dir / "peps.zip"
+
+        # gzip圧縮されたレスポンスではContent-Lengthは圧縮後のサイズ
+        mock_response = Mock()
+        mock_response.headers = {"Content-Length": "100", "Content-Encoding": "gzip"}
+        mock_response.iter_content = Mock(return_value=[b"decoded"])
+        mock_response.raise_for_status = Mock()
+
+        with patch.object(fetcher.session, "get", return_value=mock_response):
+            fetcher.download_repo(PEP_REPO_URL, output_path)
+
+        assert output_path.read_bytes() == b"decoded"
+
+    def test_download_failure_leaves_no_partial_file(self, fetcher, temp_dir):
+        """Test that a download failing mid-stream leaves no file behind."""
+        output_path = temp_dir / "peps.zip"
+
+        def _broken_stream(chunk_size):
+            yield b"partial"
+            raise requests.ConnectionError("Connection reset")
+
+        mock_response = Mock()
+        mock_response.headers = {"Content-Length": "1048576"}
+        mock_response.iter_content = _broken_stream
+        mock_response.raise_for_status = Mock()
+
+        with (
+            patch.object(fetcher.session, "get", return_value=mock_response),
+            pytest.raises(requests.RequestException),
+        ):
+            fetcher.download_repo(PEP_REPO_URL, output_path)
+
+        assert list(temp_dir.iterdir()) == []
+
     def test_download_peps_repo_invalid_url(self, fetcher, temp_dir):
         """Test download with invalid URL raises error."""
         url = "https://invalid-url.example.com/nonexistent.zip"
         output_path = temp_dir / "peps.zip"
 
-        # Mock requests.get to raise an exception
-        with patch(
-            "requests.get", side_effect=requests.RequestException("Connection error")
+        # Mock session.get to raise an exception
+        with (
+            patch.object(
+                fetcher.session,
+                "get",
+                side_effect=requests.RequestException("Connection error"),
+            ),
+            pytest.raises(requests.RequestException),
+        ):
+            fetcher.download_repo(url, output_path)
+
+    def test_open_repo_stream(self, fetcher, sample_zip, temp_dir):
+        """Test downloading the repository zip into memory."""
+        mock_response = Mock()
+        mock_response.headers = {}
+        mock_response.iter_content = Mock(return_value=[sample_zip.read_bytes()])
+        mock_response.raise_for_status = Mock()
+
+        with (
+            patch.object(
+                fetcher.session, "get", return_value=mock_response
+            ) as mock_get,
+            fetcher.open_repo_stream(PEP_REPO_URL) as zf,
         ):
-            with pytest.raises(requests.RequestException):
-                fetcher.download_repo(url, output_path)
+            assert "peps-main/peps/pep-0001.rst" in zf.namelist()
+
+        assert mock_get.call_args[1]["stream"] is True
+        mock_response.close.assert_called_once()
+        # Nothing should be written to disk
+        assert list(temp_dir.iterdir()) == []
+
+    def test_open_repo_stream_invalid_url(self, fetcher):
+        """Test in-memory download with invalid URL raises error."""
+        with (
+            patch.object(
+                fetcher.session,
+                "get",
+                side_effect=requests.RequestException("Connection error"),
+            ),
+            pytest.raises(requests.RequestException),
+        ):
+            fetcher.open_repo_stream("https://invalid-url.example.com/x.zip")
+
+    def test_context_manager_closes_session(self):
+        """Test that leaving the context manager closes the HTTP session."""
+        fetcher = PEPFetcher()
+
+        with patch.object(fetcher.session, "close") as mock_close:
+            with fetcher:
+                pass
+
+            mock_close.assert_called_once()
 
     def test_extract_zip_success(self, fetcher, sample_zip, temp_dir):
         """Test successful extraction of zip file."""
@@ -96,6 +178,40 @@ class TestPEPFetcher:
         assert (result / "peps-main" / "peps" / "pep-0008.rst").exists()
         assert (result / "peps-main" / "peps" / "pep-0020.rst").exists()
 
+    def test_extract_zip_directories_and_empty_files(self, fetcher, temp_dir):
+        """Test extraction of directory entries and zero-byte files."""
+        zip_path = temp_dir / "dirs.zip"
+        extract_to = temp_dir / "extracted"
+
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("peps-main/peps/", "")
+            zf.writestr("peps-main/peps/empty.txt", "")
+            zf.writestr("peps-main/peps/pep-0001.rst", "PEP: 1\n" * 1000)
+
+        fetcher.extract_zip(zip_path, extract_to)
+
+        pep_dir = extract_to / "peps-main" / "peps"
+        assert pep_dir.is_dir()
+        assert (pep_dir / "empty.txt").read_bytes() == b""
+        assert (pep_dir / "pep-0001.rst").read_text() == "PEP: 1\n" * 1000
+
+    def test_extract_zip_truncates_existing_file_for_empty_entry(
+        self, fetcher, temp_dir
+    ):
+        """Test that an empty entry overwrites a file left by an earlier extraction."""
+        zip_path = temp_dir / "empty.zip"
+        extract_to = temp_dir / "extracted"
+        stale_file = extract_to / "peps-main" / "empty.txt"
+        stale_file.parent.mkdir(parents=True)
+        stale_file.write_text("stale content")
+
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("peps-main/empty.txt", "")
+
+        fetcher.extract_zip(zip_path, extract_to)
+
+        assert stale_file.read_bytes() == b""
+
     def test_extract_zip_invalid_file(self, fetcher, temp_dir):
         """Test extraction with invalid zip file raises error."""
         # Create a non-zip file
@@ -143,6 +259,91 @@ class TestPEPFetcher:
         assert len(pep_files) == 1
         assert pep_files[0].name == "pep-0001.rst"
 
+    def test_get_pep_files_sorted_and_skips_invalid_names(self, fetcher, temp_dir):
+        """Test that PEP files are sorted by number and invalid names are skipped."""
+        pep_dir = temp_dir / "peps"
+        pep_dir.mkdir()
+
+        (pep_dir / "pep-0020.rst").write_text("PEP: 20")
+        (pep_dir / "pep-0008.rst").write_text("PEP: 8")
+        (pep_dir / "pep-0100.rst").write_text("PEP: 100")
+        (pep_dir / "pep-abcd.rst").write_text("invalid")
+        (pep_dir / "pep-1_0.rst").write_text("invalid")
+        (pep_dir / "pep-0001.txt").write_text("not rst")
+        (pep_dir / "pep-0002.rst").mkdir()
+
+        pep_files = fetcher.get_pep_files(pep_dir)
+
+        assert [f.name for f in pep_files] == [
+            "pep-0008.rst",
+            "pep-0020.rst",
+            "pep-0100.rst",
+        ]
+
+    def test_iter_pep_contents(self, fetcher, temp_dir):
+        """Test reading PEP files directly from the zip without extracting."""
+        zip_path = temp_dir / "peps.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("peps-main/peps/", "")
+            zf.writestr("peps-main/peps/pep-0020.rst", "PEP: 20")
+            zf.writestr("peps-main/peps/pep-0000.rst", "PEP: 0")
+            zf.writestr("peps-main/peps/pep-0008.rst", "PEP: 8")
+            zf.writestr("peps-main/peps/README.md", "# README")
+            zf.writestr("peps-main/other/pep-0001.rst", "PEP: 1")
+
+        contents = list(fetcher.iter_pep_contents(zip_path))
+
+        assert contents == [
+            ("peps-main/peps/pep-0008.rst", b"PEP: 8"),
+            ("peps-main/peps/pep-0020.rst", b"PEP: 20"),
+        ]
+        # Nothing should be extracted to disk
+        assert not (temp_dir / "peps-main").exists()
+
+    def test_iter_pep_contents_from_open_zip(self, fetcher, sample_zip):
+        """Test reading PEP files from an already open zip file."""
+        with zipfile.ZipFile(sample_zip) as zf:
+            names = [name for name, _ in fetcher.iter_pep_contents(zf)]
+
+            # The caller's zip file should be left open
+            assert zf.fp is not None
+
+        assert names == [
+            "peps-main/peps/pep-0001.rst",
+            "peps-main/peps/pep-0008.rst",
+            "peps-main/peps/pep-0020.rst",
+        ]
+
+    def test_iter_pep_contents_header_only(self, fetcher, temp_dir):
+        """Test that header_only stops reading at the first blank line."""
+        zip_path = temp_dir / "peps.zip"
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("peps-main/peps/pep-0001.rst", "PEP: 1\nTitle: T\n\nBody\n")
+            zf.writestr("peps-main/peps/pep-0002.rst", "PEP: 2\r\n\r\nBody\r\n")
+            zf.writestr("peps-main/peps/pep-0003.rst", "PEP: 3\nNo blank line")
+            zf.writestr("peps-main/peps/pep-0004.rst", "\r\nPEP: 4\r\n \t\r\nBody\n")
+
+        contents = dict(fetcher.iter_pep_contents(zip_path, header_only=True))
+
+        assert contents == {
+            "peps-main/peps/pep-0001.rst": b"PEP: 1\nTitle: T\n\n",
+            "peps-main/peps/pep-0002.rst": b"PEP: 2\r\n\r\n",
+            "peps-main/peps/pep-0003.rst": b"PEP: 3\nNo blank line",
+            "peps-main/peps/pep-0004.rst": b"\r\nPEP: 4\r\n \t\r\n",
+        }
+
+    def test_read_pep_header_longer_than_read_size(self, fetcher, temp_dir):
+        """Test that headers longer than one read are read completely."""
+        zip_path = temp_dir / "peps.zip"
+        header = "PEP: 1\nAuthor: " + ",\n  ".join(["Someone"] * 100) + "\n\n"
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("pep-0001.rst", header + "Body\n" * 1000)
+
+        with zipfile.ZipFile(zip_path) as zf:
+            result = fetcher.read_pep_header(zf, zf.getinfo("pep-0001.rst"), nbytes=64)
+
+        assert result == header.encode()
+
     def test_cleanup_temp_files(self, fetcher, temp_dir):
         """Test cleanup of temporary files and directories."""
         # Create some test files and directories
@@ -164,6 +365,23 @@ class TestPEPFetcher:
         # Verify cleanup was successful
         assert not temp_dir.exists()
 
+    def test_cleanup_nested_tree_does_not_follow_symlinks(self, fetcher, temp_dir):
+        """Test cleanup of nested directories without following symlinks."""
+        outside = temp_dir / "outside"
+        outside.mkdir()
+        (outside / "keep.txt").write_text("keep")
+
+        tree = temp_dir / "tree"
+        (tree / "a" / "b" / "c").mkdir(parents=True)
+        (tree / "a" / "b" / "c" / "deep.txt").write_text("deep")
+        (tree / "a" / "file.txt").write_text("file")
+        (tree / "link").symlink_to(outside, target_is_directory=True)
+
+        fetcher.cleanup(tree)
+
+        assert not tree.exists()
+        assert (outside / "keep.txt").exists()
+
     def test_cleanup_nonexistent_path(self, fetcher, temp_dir):
         """Test cleanup with non-existent path doesn't raise error."""
         nonexistent = temp_dir / "nonexistent"
@@ -178,10 +396,13 @@ class TestPEPFetcher:
 
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.content = b"content"
+        mock_response.headers = {}
+        mock_response.iter_content = Mock(return_value=[b"content"])
         mock_response.raise_for_status = Mock()
 
-        with patch("requests.get", return_value=mock_response) as mock_get:
+        with patch.object(
+            fetcher.session, "get", return_value=mock_response
+        ) as mock_get:
             fetcher.download_repo(url, output_path, timeout=30)
 
             # Verify timeout was passed
@@ -252,3 +473,32 @@ class TestPEPFetcher:
         # Should raise ValueError when detecting path traversal
         with pytest.raises(ValueError, match="path traversal"):
             fetcher.extract_zip(malicious_zip, extract_to)
+
+    def test_extract_zip_prevents_write_through_existing_symlink(
+        self, fetcher, temp_dir
+    ):
+        """Test that members below a symlink escaping extract_to are blocked."""
+        malicious_zip = temp_dir / "malicious_existing_symlink.zip"
+        extract_to = temp_dir / "extracted"
+        outside = temp_dir / "outside"
+        outside.mkdir()
+        extract_to.mkdir()
+        (extract_to / "link").symlink_to(outside, target_is_directory=True)
+
+        with zipfile.ZipFile(malicious_zip, "w") as zf:
+            zf.writestr("link/passwd", "malicious content")
+
+        with pytest.raises(ValueError, match="path traversal"):
+            fetcher.extract_zip(malicious_zip, extract_to)
+        assert list(outside.iterdir()) == []
+
+    def test_extract_zip_prevents_backslash_path(self, fetcher, temp_dir):
+        """Test that member names containing backslashes are blocked."""
+        malicious_zip = temp_dir / "malicious_backslash.zip"
+        extract_to = temp_dir / "extracted"
+
+        with zipfile.ZipFile(malicious_zip, "w") as zf:
+            zf.writestr("..\\..\\evil.txt", "malicious content")
+
+        with pytest.raises(ValueError, match="path traversal"):
+            fetcher.extract_zip(malicious_zip, extract_to)
@@ -1,12 +1,34 @@
 """fetch_peps.pyテスト用の共通フィクスチャ"""
 
-import shutil
+import io
 import tempfile
 import zipfile
 from pathlib import Path
 
 import pytest
 
+# fetch_peps.main() の統合テストで使うサンプルPEP
+SAMPLE_PEPS = {
+    "pep-0001.rst": """PEP: 1
+Title: Test PEP 1
+Status: Active
+Type: Process
+Created: 2000-01-01
+Author: Author One
+
+This is a test PEP that cites :pep:`8`.
+""",
+    "pep-0008.rst": """PEP: 8
+Title: Test PEP 8
+Status: Active
+Type: Process
+Created: 2001-01-01
+Author: Author Two, Author Three
+
+This is a test PEP.
+""",
+}
+
 
 def create_pep_content(pep_number: int, citations: list[int] | None = None) -> str:
     """PEPファイルの内容を生成する。
@@ -33,34 +55,68 @@ This is a test PEP{citation_text}.
 """
 
 
-def create_pep_files(pep_dir: Path, peps: dict[int, list[int] | None]) -> None:
-    """複数のPEPファイルを作成する。
+def build_mock_zip_bytes(files: dict[str, str]) -> bytes:
+    """PEPファイルを含むモックのzipファイルをメモリ上で作成する。
 
     Args:
-        pep_dir: PEPファイルを作成するディレクトリ
-        peps: {pep_number: citations} の辞書。citationsはNoneまたは引用PEP番号のリスト
+        files: {ファイル名: 内容} の辞書（例: {"pep-0001.rst": "PEP: 1 ..."}）
+
+    Returns:
+        zipファイルの内容（ディスクには書き込まない）
+
+    Note:
+        内容が小さいため圧縮せずに格納する（ZIP_STORED）。
     """
-    pep_dir.mkdir(parents=True, exist_ok=True)
-    for pep_number, citations in peps.items():
-        content = create_pep_content(pep_number, citations)
-        (pep_dir / f"pep-{pep_number:04d}.rst").write_text(content, encoding="utf-8")
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as zf:
+        for name, content in files.items():
+            zf.writestr(f"peps-main/peps/{name}", content)
+    return buffer.getvalue()
 
 
-def create_mock_zip(zip_path: Path, pep_dir: Path) -> Path:
-    """PEPディレクトリからモックのzipファイルを作成する。
+def create_mock_zip_bytes(peps: dict[int, list[int] | None]) -> bytes:
+    """{pep_number: citations} からモックのzipファイルをメモリ上で作成する。
 
     Args:
-        zip_path: 作成するzipファイルのパス
-        pep_dir: PEPファイルが含まれるディレクトリ
+        peps: {pep_number: citations} の辞書。citationsはNoneまたは引用PEP番号のリスト
 
     Returns:
-        作成されたzipファイルのパス
+        zipファイルの内容
     """
-    with zipfile.ZipFile(zip_path, "w") as zf:
-        for pep_file in pep_dir.glob("*.rst"):
-            arcname = f"peps-main/peps/{pep_file.name}"
-            zf.write(pep_file, arcname)
-    return zip_path
+    return build_mock_zip_bytes(
+        {
+            f"pep-{pep_number:04d}.rst": create_pep_content(pep_number, citations)
+            for pep_number, citations in peps.items()
+        }
+    )
+
+
+def patch_pep_download(mp: pytest.MonkeyPatch, zip_bytes: bytes) -> None:
+    """PEPFetcherのダウンロード処理をモックのzipを返すように差し替える。
+
+    Args:
+        mp: 差し替えに使うMonkeyPatch
+        zip_bytes: ダウンロード結果として返すzipファイルの内容
+
+    Note:
+        --keep-raw の有無で呼ばれる方が異なるため両方をモックする。
+    """
+
+    def mock_download_repo(self, url, output_path, timeout=60):
+        output_path.write_bytes(zip_bytes)
+        return output_path
+
+    def mock_open_repo_stream(self, url, timeout=60):
+        return zipfile.ZipFile(io.BytesIO(zip_bytes))
+
+    mp.setattr(
+        "src.data_acquisition.github_fetcher.PEPFetcher.download_repo",
+        mock_download_repo,
+    )
+    mp.setattr(
+        "src.data_acquisition.github_fetcher.PEPFetcher.open_repo_stream",
+        mock_open_repo_stream,
+    )
 
 
 @pytest.fixture
@@ -71,7 +127,7 @@ def temp_dir():
 
 
 @pytest.fixture
-def mock_download_setup(temp_dir, monkeypatch):
+def mock_download_setup(monkeypatch):
     """モックダウンロードをセットアップするファクトリフィクスチャ。
 
     Returns:
@@ -79,22 +135,27 @@ def mock_download_setup(temp_dir, monkeypatch):
     """
 
     def _setup(peps: dict[int, list[int] | None]):
-        # PEPファイルを作成
-        pep_dir = temp_dir / f"peps_{id(peps)}"
-        create_pep_files(pep_dir, peps)
+        patch_pep_download(monkeypatch, create_mock_zip_bytes(peps))
 
-        # zipファイルを作成
-        zip_path = temp_dir / f"mock_peps_{id(peps)}.zip"
-        create_mock_zip(zip_path, pep_dir)
+    return _setup
 
-        # モックをセットアップ
-        def mock_download_repo(self, url, output_path, timeout=60):
-            shutil.copy(zip_path, output_path)
-            return output_path
 
-        monkeypatch.setattr(
-            "src.data_acquisition.github_fetcher.PEPFetcher.download_repo",
-            mock_download_repo,
-        )
+@pytest.fixture(scope="session")
+def mock_zip_bytes():
+    """SAMPLE_PEPSのモックzipをセッションで一度だけ作成する。
 
-    return _setup
+    Note:
+        pytest-xdistではワーカーごとに作成されるが、メモリ上で数百バイトを
+        書くだけなので、FileLockでワーカー間共有するより安い。
+        また --dist loadfile により、このフィクスチャを使うテストファイルは
+        1つのワーカーでまとめて実行される。
+    """
+    return build_mock_zip_bytes(SAMPLE_PEPS)
+
+
+@pytest.fixture(scope="class")
+def mock_download(mock_zip_bytes):
+    """PEPFetcherのダウンロード処理をテストクラス単位で一度だけモックする。"""
+    with pytest.MonkeyPatch.context() as mp:
+        patch_pep_download(mp, mock_zip_bytes)
+        yield
@@ -1,9 +1,6 @@
 """Tests for fetch_peps.py script."""
 
 import csv
-import shutil
-import tempfile
-import zipfile
 from pathlib import Path
 
 import pytest
@@ -12,17 +9,13 @@ from scripts.fetch_peps import (
     main,
     parse_arguments,
 )
+from src.utils.hash_utils import calculate_file_hash
+from src.utils.metadata_manager import MetadataManager
 
 
 class TestFetchPepsHelpers:
     """Test cases for fetch_peps.py helper functions."""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for testing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
-
     def test_parse_arguments_defaults(self):
         """Test parse_arguments with default values."""
         args = parse_arguments([])
@@ -42,156 +35,56 @@ class TestFetchPepsHelpers:
         assert args.verbose is True
 
 
+@pytest.mark.integration
+@pytest.mark.usefixtures("mock_download")
 class TestFetchPepsIntegration:
     """Integration tests for fetch_peps.py main workflow."""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for testing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
-
-    @pytest.fixture
-    def sample_pep_files(self, temp_dir):
-        """Create sample PEP RST files for testing."""
-        pep_dir = temp_dir / "peps"
-        pep_dir.mkdir()
-
-        # PEP 1
-        (pep_dir / "pep-0001.rst").write_text(
-            """PEP: 1
-Title: Test PEP 1
-Status: Active
-Type: Process
-Created: 2000-01-01
-Author: Author One
-
-This is a test PEP that cites :pep:`8`.
-""",
-            encoding="utf-8",
-        )
-
-        # PEP 8
-        (pep_dir / "pep-0008.rst").write_text(
-            """PEP: 8
-Title: Test PEP 8
-Status: Active
-Type: Process
-Created: 2001-01-01
-Author: Author Two, Author Three
-
-This is a test PEP.
-""",
-            encoding="utf-8",
-        )
-
-        return pep_dir
+    def test_main_end_to_end(self, fs, monkeypatch):
+        """Test main() outputs and that an identical rerun would report no change."""
+        # 出力先は偽のファイルシステム上に作成する
+        work_dir = Path("/work")
+        fs.create_dir(work_dir)
+        output_dir = work_dir / "output"
 
-    def test_main_output_files_created(self, temp_dir, sample_pep_files, monkeypatch):
-        """Test that main() creates all three output files."""
-        # モックのzipファイルを作成
-        zip_path = temp_dir / "mock_peps.zip"
-        with zipfile.ZipFile(zip_path, "w") as zf:
-            for pep_file in sample_pep_files.glob("*.rst"):
-                arcname = f"peps-main/peps/{pep_file.name}"
-                zf.write(pep_file, arcname)
-
-        output_dir = temp_dir / "output"
-
-        # PEPFetcherのメソッドをモック
-        def mock_download_repo(self, url, output_path, timeout=60):
-            # モックのzipファイルをコピー
-            shutil.copy(zip_path, output_path)
-            return output_path
-
-        # main()をテスト用引数で実行
-        monkeypatch.setattr(
-            "src.data_acquisition.github_fetcher.PEPFetcher.download_repo",
-            mock_download_repo,
-        )
+        # 1回目の実行（zipをディスクに保存する）
         monkeypatch.setattr(
             "sys.argv",
             ["fetch_peps.py", "--output-dir", str(output_dir), "--keep-raw"],
         )
-
-        # main()を実行
-        exit_code = main()
+        exit_code_first = main()
 
         # 初回実行なので終了コード2（データ変更あり）を確認
-        assert exit_code == 2
+        assert exit_code_first == 2
 
         # 3つの出力ファイルが作成されたか確認
         assert (output_dir / "peps_metadata.csv").exists()
         assert (output_dir / "citations.csv").exists()
         assert (output_dir / "metadata.json").exists()
 
-    def test_main_citations_csv_has_correct_format(
-        self, temp_dir, sample_pep_files, monkeypatch
-    ):
-        """Test that citations.csv has the correct format."""
-        # モックのzipファイルを作成
-        zip_path = temp_dir / "mock_peps.zip"
-        with zipfile.ZipFile(zip_path, "w") as zf:
-            for pep_file in sample_pep_files.glob("*.rst"):
-                arcname = f"peps-main/peps/{pep_file.name}"
-                zf.write(pep_file, arcname)
-
-        output_dir = temp_dir / "output"
-
-        # PEPFetcherのメソッドをモック
-        def mock_download_repo(self, url, output_path, timeout=60):
-            shutil.copy(zip_path, output_path)
-            return output_path
-
-        monkeypatch.setattr(
-            "src.data_acquisition.github_fetcher.PEPFetcher.download_repo",
-            mock_download_repo,
-        )
-        monkeypatch.setattr(
-            "sys.argv",
-            ["fetch_peps.py", "--output-dir", str(output_dir)],
-        )
-
-        # main()を実行
-        exit_code = main()
-
-        # 初回実行なので終了コード2（データ変更あり）を確認
-        assert exit_code == 2
-
-        # citations.csvのフォーマットを確認
-        citations_path = output_dir / "citations.csv"
-        assert citations_path.exists()
-
-        with open(citations_path, "r", encoding="utf-8") as f:
+        # citations.csvのフォーマット（正しいカラムが存在するか）を確認
+        with open(output_dir / "citations.csv", "r", encoding="utf-8") as f:
             reader = csv.DictReader(f)
             fieldnames = reader.fieldnames
 
-        # 正しいカラムが存在するか確認
         expected_columns = ["citing", "cited", "count"]
         assert fieldnames == expected_columns
 
-    def test_main_no_data_change_on_second_run(
-        self, temp_dir, sample_pep_files, monkeypatch
-    ):
+        # 同じデータで再実行した場合に「変更なし」と判定されることを、
+        # パイプライン全体を再実行せずに保存済みのハッシュで確認する
+        metadata = MetadataManager().load_metadata(output_dir / "metadata.json")
+        new_hashes = {
+            "peps_metadata": calculate_file_hash(output_dir / "peps_metadata.csv"),
+            "citations": calculate_file_hash(output_dir / "citations.csv"),
+        }
+        assert MetadataManager().has_data_changed(new_hashes, metadata) is False
+
+    @pytest.mark.slow
+    def test_main_no_data_change_on_second_run(self, fs, monkeypatch):
         """Test that running main() twice with the same data returns exit code 0 on second run."""
-        # モックのzipファイルを作成
-        zip_path = temp_dir / "mock_peps.zip"
-        with zipfile.ZipFile(zip_path, "w") as zf:
-            for pep_file in sample_pep_files.glob("*.rst"):
-                arcname = f"peps-main/peps/{pep_file.name}"
-                zf.write(pep_file, arcname)
-
-        output_dir = temp_dir / "output"
-
-        # PEPFetcherのメソッドをモック
-        def mock_download_repo(self, url, output_path, timeout=60):
-            shutil.copy(zip_path, output_path)
-            return output_path
-
-        monkeypatch.setattr(
-            "src.data_acquisition.github_fetcher.PEPFetcher.download_repo",
-            mock_download_repo,
-        )
+        work_dir = Path("/work")
+        fs.create_dir(work_dir)
+        output_dir = work_dir / "output"
         monkeypatch.setattr(
             "sys.argv",
             ["fetch_peps.py", "--output-dir", str(output_dir)],
@@ -208,15 +101,16 @@ This is a test PEP.
         assert exit_code_second == 0
 
 
+@pytest.mark.integration
 class TestCitationChangesIntegration:
     """Integration tests for citation_changes.csv generation."""
 
     def test_citation_changes_not_created_on_first_run(
-        self, temp_dir, mock_download_setup, monkeypatch
+        self, tmp_path, mock_download_setup, monkeypatch
     ):
         """Test that citation_changes.csv is not created on first run."""
         # Arrange
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
         monkeypatch.setattr(
             "sys.argv",
             ["fetch_peps.py", "--output-dir", str(output_dir)],
@@ -231,13 +125,13 @@ class TestCitationChangesIntegration:
         assert not citation_changes_path.exists()
 
     def test_citation_changes_created_on_data_change(
-        self, temp_dir, mock_download_setup, monkeypatch
+        self, tmp_path, mock_download_setup, monkeypatch
     ):
         """Test that citation_changes.csv is created when citations change."""
         import pandas as pd
 
         # Arrange
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
         monkeypatch.setattr(
             "sys.argv",
             ["fetch_peps.py", "--output-dir", str(output_dir)],
@@ -264,11 +158,11 @@ class TestCitationChangesIntegration:
         assert changes_df.iloc[0]["cited"] == 20
 
     def test_citation_changes_not_created_when_no_change(
-        self, temp_dir, mock_download_setup, monkeypatch
+        self, tmp_path, mock_download_setup, monkeypatch
     ):
         """Test that citation_changes.csv is not created when no citation changes."""
         # Arrange
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
         monkeypatch.setattr(
             "sys.argv",
             ["fetch_peps.py", "--output-dir", str(output_dir)],
@@ -289,13 +183,13 @@ class TestCitationChangesIntegration:
         assert not citation_changes_path.exists()
 
     def test_citation_changes_appends_on_subsequent_changes(
-        self, temp_dir, mock_download_setup, monkeypatch
+        self, tmp_path, mock_download_setup, monkeypatch
     ):
         """Test that subsequent changes are appended to citation_changes.csv."""
         import pandas as pd
 
         # Arrange
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
         monkeypatch.setattr(
             "sys.argv",
             ["fetch_peps.py", "--output-dir", str(output_dir)],
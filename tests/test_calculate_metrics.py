@@ -1,5 +1,7 @@
 """scripts/calculate_metrics.py のテスト"""
 
+import csv
+import io
 import pickle
 
 import networkx as nx
@@ -104,38 +106,35 @@ class TestBuildPepGraph:
 class TestCalculateNodeMetrics:
     """calculate_node_metrics関数のテスト（フェーズ2.3）"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_graph(self):
-        """テスト用のサンプルグラフ"""
-        G = nx.DiGraph()
-        # PEP 1: 引用なし、3つ引用している
-        G.add_edge(1, 8)
-        G.add_edge(1, 20)
-        G.add_edge(1, 257)
-        # PEP 8: 1つ引用されている、2つ引用している
-        G.add_edge(8, 20)
-        G.add_edge(8, 234)
-        # PEP 234: 2つ引用されている、2つ引用している
-        G.add_edge(20, 234)
-        G.add_edge(234, 8)
-        G.add_edge(234, 257)
+        """テスト用のサンプルグラフ（モジュール内で共有するため読み取り専用）"""
+        G = nx.DiGraph(
+            [
+                # PEP 1: 引用なし、3つ引用している
+                (1, 8),
+                (1, 20),
+                (1, 257),
+                # PEP 8: 1つ引用されている、2つ引用している
+                (8, 20),
+                (8, 234),
+                # PEP 234: 2つ引用されている、2つ引用している
+                (20, 234),
+                (234, 8),
+                (234, 257),
+            ]
+        )
         # その他のノードを追加
-        G.add_node(257)
-        G.add_node(484)
-        G.add_node(3100)
-        G.add_node(3107)
-        G.add_node(3119)
-        G.add_node(3141)
-        return G
-
-    def test_calculate_node_metrics(self, sample_graph):
-        """各種メトリクスが正しく計算されるか"""
-        # Given
-        G = sample_graph
+        G.add_nodes_from([257, 484, 3100, 3107, 3119, 3141])
+        return nx.freeze(G)
 
-        # When
-        metrics_df = calculate_node_metrics(G)
+    @pytest.fixture(scope="module")
+    def metrics_df(self, sample_graph):
+        """sample_graphのメトリクス（一度だけ計算し、読み取り専用で共有する）"""
+        return calculate_node_metrics(sample_graph)
 
+    def test_calculate_node_metrics(self, metrics_df):
+        """各種メトリクスが正しく計算されるか"""
         # Then
         assert "pep_number" in metrics_df.columns
         assert "in_degree" in metrics_df.columns
@@ -150,14 +149,8 @@ class TestCalculateNodeMetrics:
         assert pep1_metrics["degree"] == 3
         assert 0.0 < pep1_metrics["pagerank"] < 1.0
 
-    def test_pagerank_sum_is_one(self, sample_graph):
+    def test_pagerank_sum_is_one(self, metrics_df):
         """PageRankの合計が1.0であるか"""
-        # Given
-        G = sample_graph
-
-        # When
-        metrics_df = calculate_node_metrics(G)
-
         # Then
         total_pagerank = metrics_df["pagerank"].sum()
         assert abs(total_pagerank - 1.0) < 1e-6  # 浮動小数点誤差を考慮
@@ -167,20 +160,21 @@ class TestCalculateNodeMetrics:
         # Given
         G = sample_graph
 
-        # When
-        metrics_df = calculate_node_metrics(G)
+        # When: PageRankの値は検証しないため計算を省略する
+        metrics_df = calculate_node_metrics(G, compute_pagerank=False)
 
         # Then
         assert len(metrics_df) == G.number_of_nodes()
         assert set(metrics_df["pep_number"]) == set(G.nodes())
+        assert metrics_df["pagerank"].isna().all()
 
 
 class TestSaveGraph:
     """save_graph関数のテスト（フェーズ2.5）"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_graph_with_metadata(self):
-        """メタデータ付きのサンプルグラフ"""
+        """メタデータ付きのサンプルグラフ（モジュール内で共有するため読み取り専用）"""
         G = nx.DiGraph()
         G.add_edge(1, 8)
         G.add_edge(8, 20)
@@ -188,7 +182,7 @@ class TestSaveGraph:
         G.graph["source_url"] = (
             "https://github.com/python/peps/archive/refs/heads/main.zip"
         )
-        return G
+        return nx.freeze(G)
 
     def test_save_graph_pickle(self, sample_graph_with_metadata, tmp_path):
         """DiGraphがpickleで保存できるか"""
@@ -209,18 +203,21 @@ class TestSaveGraph:
         assert G.number_of_nodes() == loaded_G.number_of_nodes()
         assert G.number_of_edges() == loaded_G.number_of_edges()
 
-    def test_graph_metadata_preserved_after_pickle(
-        self, sample_graph_with_metadata, tmp_path
-    ):
+        # 最新のpickleプロトコルで保存されている（先頭はPROTOオペコード）
+        header = output_path.read_bytes()[:2]
+        assert header == bytes([pickle.PROTO[0], pickle.HIGHEST_PROTOCOL])
+
+    def test_graph_metadata_preserved_after_pickle(self, sample_graph_with_metadata):
         """pickle保存・読み込み後もメタデータが保持されるか"""
         # Given
         G = sample_graph_with_metadata
-        output_path = tmp_path / "test_graph.pkl"
 
-        # When
-        save_graph(G, output_path)
-        with open(output_path, "rb") as f:
-            loaded_G = pickle.load(f)
+        # When: ファイルへの保存はtest_save_graph_pickleで検証済みのため、
+        # シリアライズのみをメモリ上で往復させる
+        buffer = io.BytesIO()
+        pickle.dump(G, buffer, protocol=pickle.HIGHEST_PROTOCOL)
+        buffer.seek(0)
+        loaded_G = pickle.load(buffer)
 
         # Then
         assert "fetched_at" in loaded_G.graph
@@ -260,13 +257,32 @@ class TestSaveMetrics:
         # Then
         assert output_path.exists()
 
-        # 読み込んで検証
-        loaded_df = pd.read_csv(output_path)
-        assert list(loaded_df.columns) == [
+        # 読み込んで検証（ヘッダーと行数のみなのでpandasは使わない）
+        with open(output_path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            num_rows = sum(1 for _ in reader)
+        assert header == [
             "pep_number",
             "in_degree",
             "out_degree",
             "degree",
             "pagerank",
         ]
-        assert len(loaded_df) == len(metrics_df)
+        assert num_rows == len(metrics_df)
+
+    def test_save_metrics_csv_format(self, sample_metrics_df, tmp_path):
+        """数値がそのままの表記で、LF改行のCSVとして保存されるか"""
+        # Given
+        output_path = tmp_path / "test_metrics.csv"
+
+        # When
+        save_metrics(sample_metrics_df, output_path)
+
+        # Then
+        assert output_path.read_bytes() == (
+            b"pep_number,in_degree,out_degree,degree,pagerank\n"
+            b"1,0,3,3,0.1\n"
+            b"8,1,2,3,0.2\n"
+            b"20,2,1,3,0.3\n"
+        )
@@ -6,6 +6,9 @@ import pytest
 
 from src.utils.hash_utils import calculate_file_hash
 
+# 空データのSHA256ハッシュ（既知の値）
+EMPTY_SHA256 = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+
 
 class TestHashUtils:
     """Test cases for hash utility functions."""
@@ -16,9 +19,9 @@ class TestHashUtils:
         file1 = tmp_path / "file1.txt"
         file2 = tmp_path / "file2.txt"
 
-        content = "test content\n"
-        file1.write_text(content, encoding="utf-8")
-        file2.write_text(content, encoding="utf-8")
+        content = b"test content\n"
+        file1.write_bytes(content)
+        file2.write_bytes(content)
 
         hash1 = calculate_file_hash(file1)
         hash2 = calculate_file_hash(file2)
@@ -33,8 +36,8 @@ class TestHashUtils:
         file1 = tmp_path / "file1.txt"
         file2 = tmp_path / "file2.txt"
 
-        file1.write_text("content A\n", encoding="utf-8")
-        file2.write_text("content B\n", encoding="utf-8")
+        file1.write_bytes(b"content A\n")
+        file2.write_bytes(b"content B\n")
 
         hash1 = calculate_file_hash(file1)
         hash2 = calculate_file_hash(file2)
@@ -46,8 +49,8 @@ class TestHashUtils:
         file1 = tmp_path / "file1.txt"
         file2 = tmp_path / "file2.txt"
 
-        file1.write_text("test", encoding="utf-8")
-        file2.write_text("tesx", encoding="utf-8")  # 1文字だけ違う
+        file1.write_bytes(b"test")
+        file2.write_bytes(b"tesx")  # 1バイトだけ違う
 
         hash1 = calculate_file_hash(file1)
         hash2 = calculate_file_hash(file2)
@@ -57,19 +60,18 @@ class TestHashUtils:
     def test_calculate_file_hash_empty_file(self, tmp_path):
         """Test that empty file can be hashed."""
         file = tmp_path / "empty.txt"
-        file.write_text("", encoding="utf-8")
+        file.write_bytes(b"")
 
         hash_value = calculate_file_hash(file)
 
         # 空ファイルのSHA256ハッシュは既知の値
-        expected = hashlib.sha256(b"").hexdigest()
-        assert hash_value == expected
+        assert hash_value == EMPTY_SHA256
 
     def test_calculate_file_hash_csv_file(self, tmp_path):
         """Test that CSV file can be hashed."""
         csv_file = tmp_path / "test.csv"
-        csv_content = "pep_number,title\n1,Test PEP\n8,Style Guide\n"
-        csv_file.write_text(csv_content, encoding="utf-8")
+        csv_content = b"pep_number,title\n1,Test PEP\n8,Style Guide\n"
+        csv_file.write_bytes(csv_content)
 
         hash_value = calculate_file_hash(csv_file)
 
@@ -77,7 +79,7 @@ class TestHashUtils:
 
         # 同じ内容なら同じハッシュ
         csv_file2 = tmp_path / "test2.csv"
-        csv_file2.write_text(csv_content, encoding="utf-8")
+        csv_file2.write_bytes(csv_content)
         hash_value2 = calculate_file_hash(csv_file2)
 
         assert hash_value == hash_value2
@@ -88,3 +90,24 @@ class TestHashUtils:
 
         with pytest.raises(FileNotFoundError):
             calculate_file_hash(file)
+
+    @pytest.mark.parametrize(
+        "algorithm, hex_length", [("sha256", 64), ("blake2b", 128), ("sha512", 128)]
+    )
+    def test_calculate_file_hash_algorithm(self, tmp_path, algorithm, hex_length):
+        """Test that other hashlib algorithms can be selected."""
+        file = tmp_path / "file.txt"
+        file.write_bytes(b"test content\n")
+
+        hash_value = calculate_file_hash(file, algorithm=algorithm)
+
+        assert len(hash_value) == hex_length
+        assert hash_value == hashlib.new(algorithm, b"test content\n").hexdigest()
+
+    def test_calculate_file_hash_unsupported_algorithm(self, tmp_path):
+        """Test that an unknown algorithm raises ValueError."""
+        file = tmp_path / "file.txt"
+        file.write_bytes(b"test")
+
+        with pytest.raises(ValueError):
+            calculate_file_hash(file, algorithm="not-a-hash")